@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from datetime import timedelta
 import logging
+from types import MappingProxyType
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_URL, Platform
@@ -14,7 +17,13 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .api import API as PiholeAPI
-from .const import DOMAIN, MIN_TIME_BETWEEN_UPDATES
+from .const import (
+    DOMAIN,
+    MAX_TIME_BETWEEN_UPDATES,
+    MIN_TIME_BETWEEN_UPDATES,
+    PADD_BLOCKING_FIELDS,
+)
+from .exceptions import TooManyRequestsException, UnauthorizedException
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +35,25 @@ PLATFORMS = [
     # Platform.UPDATE,
 ]
 
+# Unique ID suffixes used before the entities were given translation keys.
+NAME_TO_KEY = MappingProxyType(
+    {
+        "Core Update Available": "core_update_available",
+        "Web Update Available": "web_update_available",
+        "FTL Update Available": "ftl_update_available",
+        "Status": "status",
+        "Ads Blocked Today": "ads_blocked_today",
+        "Ads Percentage Blocked Today": "ads_percentage_today",
+        "Seen Clients": "clients_ever_seen",
+        "DNS Queries Today": "dns_queries_today",
+        "Domains Blocked": "domains_being_blocked",
+        "DNS Queries Cached": "queries_cached",
+        "DNS Queries Forwarded": "queries_forwarded",
+        "DNS Unique Clients": "unique_clients",
+        "DNS Unique Domains": "unique_domains",
+    }
+)
+
 type PiHoleV6ConfigEntry = ConfigEntry[PiHoleV6Data]
 
 
@@ -45,38 +73,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: PiHoleV6ConfigEntry) ->
 
     _LOGGER.debug("Setting up %s integration with host %s", DOMAIN, url)
 
-    name_to_key = {
-        "Core Update Available": "core_update_available",
-        "Web Update Available": "web_update_available",
-        "FTL Update Available": "ftl_update_available",
-        "Status": "status",
-        "Ads Blocked Today": "ads_blocked_today",
-        "Ads Percentage Blocked Today": "ads_percentage_today",
-        "Seen Clients": "clients_ever_seen",
-        "DNS Queries Today": "dns_queries_today",
-        "Domains Blocked": "domains_being_blocked",
-        "DNS Queries Cached": "queries_cached",
-        "DNS Queries Forwarded": "queries_forwarded",
-        "DNS Unique Clients": "unique_clients",
-        "DNS Unique Domains": "unique_domains",
-    }
-
-    @callback
-    def update_unique_id(
-        entity_entry: er.RegistryEntry,
-    ) -> dict[str, str] | None:
-        """Update unique ID of entity entry."""
-        unique_id_parts = entity_entry.unique_id.split("/")
-        if len(unique_id_parts) == 2 and unique_id_parts[1] in name_to_key:
-            name = unique_id_parts[1]
-            new_unique_id = entity_entry.unique_id.replace(name, name_to_key[name])
-            _LOGGER.debug("Migrate %s to %s", entity_entry.unique_id, new_unique_id)
-            return {"new_unique_id": new_unique_id}
-
-        return None
-
-    await er.async_migrate_entries(hass, entry.entry_id, update_unique_id)
-
     session = async_get_clientsession(hass, False)
     api_client = PiholeAPI(
         session=session,
@@ -86,18 +82,62 @@ async def async_setup_entry(hass: HomeAssistant, entry: PiHoleV6ConfigEntry) ->
     )
 
     async def async_update_data() -> None:
-        """Fetch data from API endpoint."""
-
-        if not isinstance(await api_client.call_summary(), dict):
-            raise ConfigEntryAuthFailed
-
-        if not isinstance(await api_client.call_blocking_status(), dict):
-            raise ConfigEntryAuthFailed
-
-        if not isinstance(await api_client.call_padd(), dict):
-            raise ConfigEntryAuthFailed
-
-        if not isinstance(await api_client.call_get_groups(), dict):
+        """Fetch data from API endpoint.
+
+        The update interval is backed off while the Pi-hole rejects the credentials
+        or asks to slow down, and restored after the next successful update.
+
+        """
+
+        try:
+            await async_fetch_data()
+
+        except UnauthorizedException:
+            # Doubled once per failed refresh, however many requests were rejected.
+            coordinator.update_interval = min(
+                coordinator.update_interval * 2, MAX_TIME_BETWEEN_UPDATES
+            )
+            raise
+
+        except TooManyRequestsException as err:
+            coordinator.update_interval = min(
+                max(
+                    timedelta(seconds=err.retry_after or 0),
+                    MIN_TIME_BETWEEN_UPDATES * 2,
+                ),
+                MAX_TIME_BETWEEN_UPDATES,
+            )
+            raise
+
+        coordinator.update_interval = MIN_TIME_BETWEEN_UPDATES
+
+    async def async_fetch_data() -> None:
+        """Fetch the summary, PADD, blocking status and groups."""
+
+        results = await asyncio.gather(
+            api_client.call_summary(),
+            api_client.call_padd(),
+            api_client.call_get_groups(),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+            if not isinstance(result, dict):
+                raise ConfigEntryAuthFailed
+
+        # The blocking status is part of the PADD payload, only fetch it when missing.
+        blocking = {
+            key: api_client.cache_padd[field]
+            for key, field in PADD_BLOCKING_FIELDS.items()
+            if field in api_client.cache_padd
+        }
+
+        if len(blocking) == len(PADD_BLOCKING_FIELDS):
+            api_client.cache_blocking = blocking
+        elif not isinstance(await api_client.call_blocking_status(), dict):
             raise ConfigEntryAuthFailed
 
     coordinator = DataUpdateCoordinator(
@@ -115,6 +155,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: PiHoleV6ConfigEntry) ->
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old Pi-hole V6 entry."""
+
+    _LOGGER.debug("Migrating %s entry from version %s", DOMAIN, entry.version)
+
+    if entry.version == 1:
+
+        @callback
+        def update_unique_id(
+            entity_entry: er.RegistryEntry,
+        ) -> dict[str, str] | None:
+            """Update unique ID of entity entry."""
+            unique_id_parts = entity_entry.unique_id.split("/")
+            if len(unique_id_parts) == 2 and unique_id_parts[1] in NAME_TO_KEY:
+                name = unique_id_parts[1]
+                new_unique_id = entity_entry.unique_id.replace(name, NAME_TO_KEY[name])
+                _LOGGER.debug("Migrate %s to %s", entity_entry.unique_id, new_unique_id)
+                return {"new_unique_id": new_unique_id}
+
+            return None
+
+        await er.async_migrate_entries(hass, entry.entry_id, update_unique_id)
+        hass.config_entries.async_update_entry(entry, version=2)
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Pi-hole entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -1,38 +1,78 @@
 """The above class represents Pi-Hole API Client with methods for authentication, retrieving summary data, managing blocking status, and logging requests."""
 
 import asyncio
-import copy
+from collections import deque
 import hashlib
+import json
 import logging
+import math
+import statistics
+import time
 from socket import gaierror as GaiError
 from typing import Any
 
-from aiohttp import ClientError, ContentTypeError
-import requests
+from aiohttp import ClientError, ClientResponse, ClientTimeout, ContentTypeError
 
+from .const import MAX_TIME_BETWEEN_UPDATES
 from .exceptions import (
     ClientConnectorException,
     ContentTypeException,
+    TooManyRequestsException,
     UnauthorizedException,
     handle_status,
 )
 
+REQUEST_TIMEOUT = ClientTimeout(total=30, connect=5, sock_connect=5, sock_read=15)
+REQUEST_TIMEOUT_MIN_READ = 1
+REQUEST_LATENCY_SAMPLES = 256
+REQUEST_LATENCY_MIN_SAMPLES = 10
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds requested by a `Retry-After` header, if any.
+
+    The delay is bounded by the longest interval between two updates.
+
+    """
+
+    if value is None:
+        return None
+
+    try:
+        delay: float = float(value)
+    except ValueError:
+        return None
+
+    if not math.isfinite(delay):
+        return None
+
+    return min(max(0.0, delay), MAX_TIME_BETWEEN_UPDATES.total_seconds())
+
 
 class API:
     """Pi-Hole API Client."""
 
     _logger: logging.Logger | None
-    _password: Any = ""
     _session: Any = None
     _sid: str | None = None
+    _sid_hash: str | None = None
+    _sid_validity: float = 0
+    _sid_expires: float = 0
 
-    cache_blocking: dict[str, Any] = {}
-    cache_padd: dict[str, Any] = {}
-    cache_summary: dict[str, Any] = {}
-    cache_groups: dict[str, dict[str, Any]] = {}
+    cache_blocking: dict[str, Any]
+    cache_padd: dict[str, Any]
+    cache_summary: dict[str, Any]
+    cache_groups: dict[str, dict[str, Any]]
 
     url: str = ""
 
+    _METHODS: frozenset[str] = frozenset(("GET", "POST", "PUT", "DELETE"))
+    _BASE_HEADERS: dict[str, str] = {
+        "accept": "application/json",
+        "content-type": "application/json",
+    }
+    _PADD_URL: dict[bool, str] = {True: "/padd?full=true", False: "/padd?full=false"}
+
     def __init__(  # noqa: D417
         self,
         session,
@@ -50,9 +90,19 @@ class API:
 
         self.url = url
         self._logger = logger
-        self._password = password
+        self._login_body: bytes = json.dumps({"password": password}).encode("utf-8")
         self._session = session
 
+        self.cache_blocking = {}
+        self.cache_padd = {}
+        self.cache_summary = {}
+        self.cache_groups = {}
+
+        self._login_task: asyncio.Future[dict[str, Any]] | None = None
+        self._headers: dict[str, str] = dict(self._BASE_HEADERS)
+        self._latencies: deque[float] = deque(maxlen=REQUEST_LATENCY_SAMPLES)
+        self._timeout: ClientTimeout = REQUEST_TIMEOUT
+
     def _get_logger(self) -> logging.Logger:
         """Return a logger if it exists, otherwise it creates a new logger.
 
@@ -75,6 +125,9 @@ class API:
     ) -> dict[str, Any]:
         """Send HTTP requests with specified method, route, and data.
 
+        The session is opened beforehand if needed. If the session is rejected by the server,
+        a new one is opened and the request is sent again once.
+
         Args:
             route (str): Represents the specific endpoint that you want to call.
             method (str): Represents the HTTP method to be used. It can be one of the following: "post", "delete", or "get".
@@ -86,58 +139,117 @@ class API:
 
         """
 
-        await self._check_authentification(action)
-        await self._request_login(action)
+        method = method.upper()
 
-        self._get_logger().debug("Session ID Hash: %s", self._get_sid_hash(self._sid))
+        if method not in self._METHODS:
+            raise RuntimeError("Method is not supported/implemented.")
 
-        url: str = f"{self.url}{route}"
+        self._check_authentification(action)
+        await self._request_login()
 
-        headers: dict[str, str] = {
-            "accept": "application/json",
-            "content-type": "application/json",
-        }
+        logger: logging.Logger = self._get_logger()
+        debug: bool = logger.isEnabledFor(logging.DEBUG)
 
-        if self._sid is not None:
-            headers = headers | {"sid": self._sid}
-
-        self._get_logger().debug("Request: %s %s", method.upper(), url)
+        if debug:
+            logger.debug("Session ID Hash: %s", self._get_sid_hash())
 
-        request: requests.Response
+        sid: str | None = self._sid
 
         try:
-            async with asyncio.timeout(600):
-                if method.lower() == "post":
-                    request = await self._session.post(url, json=data, headers=headers)
-                elif method.lower() == "put":
-                    request = await self._session.put(url, json=data, headers=headers)
-                elif method.lower() == "delete":
-                    request = await self._session.delete(url, headers=headers)
-                elif method.lower() == "get":
-                    request = await self._session.get(url, headers=headers)
-                else:
-                    raise RuntimeError("Method is not supported/implemented.")
+            result: dict[str, Any] = await self._raw_request(route, method, data)
 
-        except (TimeoutError, ClientError, GaiError) as err:
-            raise ClientConnectorException from err
+        except UnauthorizedException:
+            if sid is None or action == "authentification_status":
+                raise
 
-        result_data: dict[str, Any] = {}
+            if self._sid == sid:
+                self._set_sid(None)
+
+            await self._request_login()
+            result = await self._raw_request(route, method, data)
 
-        self._get_logger().debug("Status Code: %d", request.status)
-        handle_status(request.status)
+        # logger.debug("Data: %s", result["data"])
 
-        if request.status < 400 and request.text != "":
-            try:
+        return result
+
+    async def _raw_request(
+        self,
+        route: str,
+        method: str,
+        data: dict[str, Any] | bytes | None = None,
+        with_sid: bool = True,
+    ) -> dict[str, Any]:
+        """Send a single HTTP request without any session handling.
+
+        Args:
+            route (str): Represents the specific endpoint that you want to call.
+            method (str): Represents the HTTP method to be used, in uppercase.
+            data (dict[str, Any] | bytes | None): Used to pass a dictionary to be sent as JSON in the request body, or an already encoded JSON body.
+            with_sid (bool): Whether to send the current session ID with the request.
+
+        Returns:
+          result (dict[str, Any]): A dictionary is being returned with keys "code", "reason", and "data".
+
+        """
+
+        logger: logging.Logger = self._get_logger()
+        debug: bool = logger.isEnabledFor(logging.DEBUG)
+
+        url: str = f"{self.url}{route}"
+
+        if debug:
+            logger.debug("Request: %s %s", method, url)
+
+        headers: dict[str, str] = self._headers if with_sid else self._BASE_HEADERS
+
+        # Only the polled reads use the adaptive timeout: logins and writes are rarer
+        # and slower, so they keep the default one and are not sampled.
+        adaptive: bool = method == "GET"
+        timeout: ClientTimeout = self._timeout if adaptive else REQUEST_TIMEOUT
+
+        request: ClientResponse
+        result_data: dict[str, Any] = {}
+        started: float = time.monotonic()
+
+        try:
+            if isinstance(data, bytes):
+                request = await self._session.request(
+                    method, url, data=data, headers=headers, timeout=timeout
+                )
+            else:
+                request = await self._session.request(
+                    method, url, json=data, headers=headers, timeout=timeout
+                )
+
+            if debug:
+                logger.debug("Status Code: %d", request.status)
+
+            if request.status == 429:
+                raise TooManyRequestsException(
+                    retry_after=_parse_retry_after(request.headers.get("Retry-After"))
+                )
+
+            handle_status(request.status)
+
+            if request.text != "":
                 result_data = await request.json()
-                result_data_debug: dict[str, Any] = copy.deepcopy(result_data)
 
-                if action == "login":
-                    result_data_debug["session"]["sid"] = "[redacted]"
+        except ContentTypeError as err:
+            raise ContentTypeException from err
+
+        except (TimeoutError, ClientError, GaiError) as err:
+            if adaptive and isinstance(err, TimeoutError):
+                # Fall back to the default timeout until new latencies are observed.
+                self._latencies.clear()
+                self._timeout = REQUEST_TIMEOUT
+
+            raise ClientConnectorException from err
 
-                # self._get_logger().debug("Data: %s", result_data_debug)
+        if adaptive:
+            self._record_latency(time.monotonic() - started)
 
-            except ContentTypeError as err:
-                raise ContentTypeException from err
+        if with_sid and self._sid is not None:
+            self._sid_expires = time.monotonic() + self._sid_validity
 
         return {
             "code": request.status,
@@ -145,56 +257,104 @@ class API:
             "data": result_data,
         }
 
-    async def _check_authentification(self, action: str) -> None:
-        """..."""
+    def _record_latency(self, latency: float) -> None:
+        """Record the latency of a successful GET request and adapt its read timeout.
 
-        try:
-            if (
-                action not in ("login", "authentification_status")
-                and self._sid is not None
-            ):
-                response: dict[str, Any] = await self.call_authentification_status()
-
-                if (
-                    response["code"] != 200
-                    or response["data"]["session"]["valid"] is False
-                ):
-                    self._sid = None
+        Once enough samples are collected, the read timeout is set to twice the 90th percentile
+        of the observed latencies, bounded by the default read timeout.
 
-        except UnauthorizedException:
-            self._sid = None
+        Args:
+          latency (float): Represents the duration of the request in seconds.
 
-    async def _request_login(self, action: str) -> None:
-        """..."""
+        """
 
-        if action != "login" and self._sid is None:
-            await self.call_login()
+        self._latencies.append(latency)
 
-    def _get_sid_hash(self, sid: str) -> str | None:
-        """..."""
+        if len(self._latencies) < REQUEST_LATENCY_MIN_SAMPLES:
+            return
+
+        p90: float = statistics.quantiles(self._latencies, n=10)[-1]
+        sock_read: float = min(
+            max(REQUEST_TIMEOUT_MIN_READ, p90 * 2), REQUEST_TIMEOUT.sock_read
+        )
+
+        if sock_read != self._timeout.sock_read:
+            self._timeout = ClientTimeout(
+                total=REQUEST_TIMEOUT.total,
+                connect=REQUEST_TIMEOUT.connect,
+                sock_connect=REQUEST_TIMEOUT.sock_connect,
+                sock_read=sock_read,
+            )
+
+    def _check_authentification(self, action: str | None) -> None:
+        """Drop the cached session once its validity period has elapsed.
+
+        The session is otherwise trusted as is: a rejected session is detected when a call returns 401.
+
+        """
+
+        if (
+            action != "authentification_status"
+            and self._sid is not None
+            and time.monotonic() >= self._sid_expires
+        ):
+            self._set_sid(None)
+
+    async def _request_login(self) -> None:
+        """Open a session if none is currently cached.
+
+        Concurrent callers wait for the same login request and all receive its result or exception.
+
+        """
 
         if self._sid is not None:
-            return str(hashlib.sha256(self._sid.encode("utf-8")).hexdigest())
+            return
 
-        return None
+        if self._login_task is None:
+            self._login_task = asyncio.ensure_future(self.call_login())
+            self._login_task.add_done_callback(self._clear_login_task)
+
+        await asyncio.shield(self._login_task)
+
+    def _clear_login_task(self, task: asyncio.Future[dict[str, Any]]) -> None:
+        """Forget the login attempt once it is over so that the next one can be made."""
+
+        if self._login_task is task:
+            self._login_task = None
+
+    def _set_sid(self, sid: str | None) -> None:
+        """Store the session ID and keep the request headers in sync with it.
+
+        Args:
+          sid (str | None): Represents the session ID returned at login, or `None` to drop the session.
+
+        """
+
+        self._sid = sid
+
+        if sid is None:
+            self._sid_hash = None
+            self._headers.pop("sid", None)
+        else:
+            self._sid_hash = hashlib.sha256(sid.encode("utf-8")).hexdigest()
+            self._headers["sid"] = sid
+
+    def _get_sid_hash(self) -> str | None:
+        """..."""
+
+        return self._sid_hash
 
     async def call_authentification_status(self) -> dict[str, Any]:
         """..."""
 
         url: str = "/auth"
 
-        result: dict[str, Any] = await self._call(
+        return await self._call(
             url,
             action="authentification_status",
             method="GET",
         )
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
-
     async def call_login(self) -> dict[str, Any]:
         """Authenticate a user with a password.
 
@@ -208,20 +368,18 @@ class API:
 
         url: str = "/auth"
 
-        result: dict[str, Any] = await self._call(
+        result: dict[str, Any] = await self._raw_request(
             url,
-            action="login",
-            method="POST",
-            data={"password": self._password},
+            "POST",
+            data=self._login_body,
+            with_sid=False,
         )
 
-        self._sid = result["data"]["session"]["sid"]
+        self._set_sid(result["data"]["session"]["sid"])
+        self._sid_validity = result["data"]["session"]["validity"]
+        self._sid_expires = time.monotonic() + self._sid_validity
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
     async def call_logout(self) -> dict[str, Any]:
         """Drop the current session.
@@ -239,13 +397,9 @@ class API:
             method="DELETE",
         )
 
-        self._sid = None
+        self._set_sid(None)
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
     async def call_summary(self) -> dict[str, Any]:
         """Retrieve an overview of Pi-hole activity.
@@ -265,11 +419,7 @@ class API:
 
         self.cache_summary = result["data"]
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
     async def call_padd(self, full: bool = True) -> dict[str, Any]:
         """Retrieve the Pi-hole API Dashboard information.
@@ -279,7 +429,7 @@ class API:
 
         """
 
-        url: str = f"/padd?full={str(full).lower()}"
+        url: str = self._PADD_URL[full]
 
         result: dict[str, Any] = await self._call(
             url,
@@ -289,11 +439,7 @@ class API:
 
         self.cache_padd = result["data"]
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
     async def call_blocking_status(self) -> dict[str, Any]:
         """Retrieve current blocking status.
@@ -313,11 +459,7 @@ class API:
 
         self.cache_blocking = result["data"]
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
     async def call_blocking_enabled(self) -> dict[str, Any]:
         """Enable blocking for DNS requests.
@@ -337,11 +479,7 @@ class API:
         )
         self.cache_blocking = result["data"]
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
     async def call_blocking_disabled(
         self, duration: int | None = 120
@@ -367,11 +505,7 @@ class API:
 
         self.cache_blocking = result["data"]
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
     async def call_get_groups(self) -> dict[str, Any]:
         """Retrieve the list of Pi-hole groups.
@@ -389,21 +523,25 @@ class API:
             method="GET",
         )
 
-        for group in result["data"]["groups"]:
-            self.cache_groups[group["name"]] = {
-                "name": group["name"],
-                "comment": group["comment"],
-                "enabled": group["enabled"],
+        self.cache_groups.update(
+            {
+                group["name"]: {
+                    "name": group["name"],
+                    "comment": group["comment"],
+                    "enabled": group["enabled"],
+                }
+                for group in result["data"]["groups"]
             }
+        )
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        return result
 
-    async def call_group_disable(self, group: str) -> dict[str, Any]:
-        """Disable Pi-hole group.
+    async def _set_group_enabled(self, group: str, enabled: bool) -> dict[str, Any]:
+        """Enable or disable Pi-hole group.
+
+        Args:
+          group (str): Represents the name of the group to update.
+          enabled (bool): Represents the new state of the group.
 
         Returns:
           result (dict[str, Any]): A dictionary with the keys "code", "reason", and "data".
@@ -414,44 +552,35 @@ class API:
 
         result: dict[str, Any] = await self._call(
             url,
-            action="group-disable",
+            action="group-enable" if enabled else "group-disable",
             method="PUT",
             data={
                 "name": group,
                 "comment": self.cache_groups[group]["comment"],
-                "enabled": False,
+                "enabled": enabled,
             },
         )
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        self.cache_groups[group]["enabled"] = enabled
 
-    async def call_group_enable(self, group: str) -> dict[str, Any]:
-        """Enable Pi-hole group.
+        return result
+
+    async def call_group_disable(self, group: str) -> dict[str, Any]:
+        """Disable Pi-hole group.
 
         Returns:
           result (dict[str, Any]): A dictionary with the keys "code", "reason", and "data".
 
         """
 
-        url: str = f"/groups/{group}"
+        return await self._set_group_enabled(group, False)
 
-        result: dict[str, Any] = await self._call(
-            url,
-            action="group-disable",
-            method="PUT",
-            data={
-                "name": group,
-                "comment": self.cache_groups[group]["comment"],
-                "enabled": True,
-            },
-        )
+    async def call_group_enable(self, group: str) -> dict[str, Any]:
+        """Enable Pi-hole group.
 
-        return {
-            "code": result["code"],
-            "reason": result["reason"],
-            "data": result["data"],
-        }
+        Returns:
+          result (dict[str, Any]): A dictionary with the keys "code", "reason", and "data".
+
+        """
+
+        return await self._set_group_enabled(group, True)
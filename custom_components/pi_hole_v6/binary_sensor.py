@@ -49,7 +49,7 @@ async def async_setup_entry(
     """Set up the Pi-hole V6 binary sensor."""
     name = entry.data[CONF_NAME]
     hole_data = entry.runtime_data
-    binary_sensors = [
+    async_add_entities(
         PiHoleV6BinarySensor(
             hole_data.api,
             hole_data.coordinator,
@@ -58,8 +58,7 @@ async def async_setup_entry(
             description,
         )
         for description in BINARY_SENSOR_TYPES
-    ]
-    async_add_entities(binary_sensors, True)
+    )
 
 
 class PiHoleV6BinarySensor(PiHoleV6Entity, BinarySensorEntity):
@@ -26,7 +26,7 @@ _LOGGER = logging.getLogger(__name__)
 class PiHoleV6dFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a Pi-hole V6 config flow."""
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
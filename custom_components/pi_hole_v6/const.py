@@ -12,3 +12,11 @@ SERVICE_DISABLE_ATTR_DURATION = "duration"
 SERVICE_ENABLE = "enable"
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=300)
+MAX_TIME_BETWEEN_UPDATES = timedelta(seconds=3600)
+
+# Fields of the blocking status ("/dns/blocking") which are also returned by the PADD
+# endpoint ("/padd"), mapped to their name in the PADD payload. The PADD payload only
+# carries a subset of the statistics summary ("/stats/summary"), which is still fetched.
+PADD_BLOCKING_FIELDS = {
+    "blocking": "blocking",
+}
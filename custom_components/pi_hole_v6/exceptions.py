@@ -1,7 +1,11 @@
 """The above classes represent the specific exceptions raised during the Pi-Hole API calls."""
 
 
-class BadGatewayException(Exception):
+class PiHoleAPIException(Exception):
+    """The class `PiHoleAPIException` is the base class of the exceptions raised for an HTTP error status returned by the API."""
+
+
+class BadGatewayException(PiHoleAPIException):
     """The class `BadGatewayException` represents an exception for receiving an invalid response from an upstream server."""
 
     def __init__(  # noqa: D107
@@ -12,7 +16,7 @@ class BadGatewayException(Exception):
         super().__init__(self.message)
 
 
-class BadRequestException(Exception):
+class BadRequestException(PiHoleAPIException):
     """The class `BadRequestException` is defined for requests that are unacceptable."""
 
     def __init__(  # noqa: D107
@@ -45,7 +49,7 @@ class ContentTypeException(Exception):
         super().__init__(self.message)
 
 
-class ForbiddenException(Exception):
+class ForbiddenException(PiHoleAPIException):
     """The class `ForbiddenException` represents an exception for when an API key lacks the necessary permissions for a request."""
 
     def __init__(  # noqa: D107
@@ -56,7 +60,7 @@ class ForbiddenException(Exception):
         super().__init__(self.message)
 
 
-class GatewayTimeoutException(Exception):
+class GatewayTimeoutException(PiHoleAPIException):
     """The class `GatewayTimeoutException` represents an exception that occurs when a server acting as a gateway times out waiting for another server."""
 
     def __init__(  # noqa: D107
@@ -67,7 +71,7 @@ class GatewayTimeoutException(Exception):
         super().__init__(self.message)
 
 
-class NotFoundException(Exception):
+class NotFoundException(PiHoleAPIException):
     """The class `NotFoundException` represents a situation where a requested resource does not exist."""
 
     def __init__(  # noqa: D107
@@ -78,7 +82,7 @@ class NotFoundException(Exception):
         super().__init__(self.message)
 
 
-class RequestFailedException(Exception):
+class RequestFailedException(PiHoleAPIException):
     """The class `RequestFailedException` defines an exception for when a request fails."""
 
     def __init__(  # noqa: D107
@@ -89,7 +93,7 @@ class RequestFailedException(Exception):
         super().__init__(self.message)
 
 
-class ServerErrorException(Exception):
+class ServerErrorException(PiHoleAPIException):
     """The class `ServerErrorException` defines an exception for internal server errors."""
 
     def __init__(  # noqa: D107
@@ -100,7 +104,7 @@ class ServerErrorException(Exception):
         super().__init__(self.message)
 
 
-class ServiceUnavailableException(Exception):
+class ServiceUnavailableException(PiHoleAPIException):
     """The class `ServiceUnavailableException` defines an exception for when the server is temporarily unavailable."""
 
     def __init__(  # noqa: D107
@@ -111,18 +115,20 @@ class ServiceUnavailableException(Exception):
         super().__init__(self.message)
 
 
-class TooManyRequestsException(Exception):
+class TooManyRequestsException(PiHoleAPIException):
     """The class `TooManyRequestsException` represents hitting the API with too many requests too quickly."""
 
     def __init__(  # noqa: D107
         self,
         message: str = "Too many requests hit the API too quickly.",
+        retry_after: float | None = None,
     ) -> None:
         self.message = message
+        self.retry_after = retry_after
         super().__init__(self.message)
 
 
-class UnauthorizedException(Exception):
+class UnauthorizedException(PiHoleAPIException):
     """The class `UnauthorizedException` is used to raise an exception when no session identity is provided for an endpoint requiring authorization."""
 
     def __init__(  # noqa: D107
@@ -133,6 +139,20 @@ class UnauthorizedException(Exception):
         super().__init__(self.message)
 
 
+_STATUS_EXCEPTIONS: dict[int, type[PiHoleAPIException]] = {
+    400: BadRequestException,
+    401: UnauthorizedException,
+    402: RequestFailedException,
+    403: ForbiddenException,
+    404: NotFoundException,
+    429: TooManyRequestsException,
+    500: ServerErrorException,
+    502: BadGatewayException,
+    503: ServiceUnavailableException,
+    504: GatewayTimeoutException,
+}
+
+
 def handle_status(status_code: int) -> None:
     """Raise specific exceptions based on the input status code.
 
@@ -148,20 +168,9 @@ def handle_status(status_code: int) -> None:
     if status_code < 400:
         return
 
-    exception_map = {
-        400: BadRequestException,
-        401: UnauthorizedException,
-        402: RequestFailedException,
-        403: ForbiddenException,
-        404: NotFoundException,
-        429: TooManyRequestsException,
-        500: ServerErrorException,
-        502: BadGatewayException,
-        503: ServiceUnavailableException,
-        504: GatewayTimeoutException,
-    }
-
-    if status_code in exception_map:
-        raise exception_map[status_code]()  # noqa: RSE102
+    exception = _STATUS_EXCEPTIONS.get(status_code)
+
+    if exception is not None:
+        raise exception()  # noqa: RSE102
 
     raise NotImplementedError(f"Unexpected error: Status code {status_code}")
@@ -4,53 +4,36 @@ from __future__ import annotations
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.const import CONF_NAME, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import PiHoleV6ConfigEntry
 from .api import API as ClientAPI
 from .entity import PiHoleV6Entity
 
-SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
-        key="ads_blocked_today",
-        translation_key="ads_blocked_today",
-    ),
-    SensorEntityDescription(
-        key="ads_percentage_today",
-        translation_key="ads_percentage_today",
-        native_unit_of_measurement=PERCENTAGE,
-    ),
-    SensorEntityDescription(
-        key="clients_ever_seen",
-        translation_key="clients_ever_seen",
-    ),
-    SensorEntityDescription(
-        key="dns_queries_today",
-        translation_key="dns_queries_today",
-    ),
-    SensorEntityDescription(
-        key="domains_being_blocked",
-        translation_key="domains_being_blocked",
-    ),
-    SensorEntityDescription(
-        key="queries_cached",
-        translation_key="queries_cached",
-    ),
-    SensorEntityDescription(
-        key="queries_forwarded",
-        translation_key="queries_forwarded",
-    ),
-    SensorEntityDescription(
-        key="unique_clients",
-        translation_key="unique_clients",
-    ),
+# Location of each sensor value in the statistics summary, as (section, field).
+_SENSOR_PATHS: dict[str, tuple[str, str]] = {
+    "ads_blocked_today": ("queries", "blocked"),
+    "ads_percentage_today": ("queries", "percent_blocked"),
+    "clients_ever_seen": ("clients", "total"),
+    "dns_queries_today": ("queries", "total"),
+    "domains_being_blocked": ("gravity", "domains_being_blocked"),
+    "queries_cached": ("queries", "cached"),
+    "queries_forwarded": ("queries", "forwarded"),
+    "unique_clients": ("clients", "active"),
+    "unique_domains": ("queries", "unique_domains"),
+}
+
+SENSOR_TYPES: tuple[SensorEntityDescription, ...] = tuple(
     SensorEntityDescription(
-        key="unique_domains",
-        translation_key="unique_domains",
-    ),
+        key=key,
+        translation_key=key,
+        native_unit_of_measurement=(
+            PERCENTAGE if key == "ads_percentage_today" else None
+        ),
+    )
+    for key in _SENSOR_PATHS
 )
 
 
@@ -62,7 +45,7 @@ async def async_setup_entry(
     """Set up the Pi-hole V6 sensor."""
     name = entry.data[CONF_NAME]
     hole_data = entry.runtime_data
-    sensors = [
+    async_add_entities(
         PiHoleV6Sensor(
             hole_data.api,
             hole_data.coordinator,
@@ -71,8 +54,7 @@ async def async_setup_entry(
             description,
         )
         for description in SENSOR_TYPES
-    ]
-    async_add_entities(sensors, True)
+    )
 
 
 class PiHoleV6Sensor(PiHoleV6Entity, SensorEntity):
@@ -94,29 +76,15 @@ class PiHoleV6Sensor(PiHoleV6Entity, SensorEntity):
         self.entity_description = description
 
         self._attr_unique_id = f"{self._server_unique_id}/{description.key}"
+        self._section, self._field = _SENSOR_PATHS[description.key]
+        self._update_native_value()
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the device."""
-
-        match self.entity_description.key:
-            case "ads_blocked_today":
-                return self.api.cache_summary["queries"]["blocked"]
-            case "ads_percentage_today":
-                return self.api.cache_summary["queries"]["percent_blocked"]
-            case "clients_ever_seen":
-                return self.api.cache_summary["clients"]["total"]
-            case "dns_queries_today":
-                return self.api.cache_summary["queries"]["total"]
-            case "domains_being_blocked":
-                return self.api.cache_summary["gravity"]["domains_being_blocked"]
-            case "queries_cached":
-                return self.api.cache_summary["queries"]["cached"]
-            case "queries_forwarded":
-                return self.api.cache_summary["queries"]["forwarded"]
-            case "unique_clients":
-                return self.api.cache_summary["clients"]["active"]
-            case "unique_domains":
-                return self.api.cache_summary["queries"]["unique_domains"]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        super()._handle_coordinator_update()
 
-        return ""
+    def _update_native_value(self) -> None:
+        """Read the state of the device from the statistics summary."""
+        self._attr_native_value = self.api.cache_summary[self._section][self._field]
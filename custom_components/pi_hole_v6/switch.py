@@ -18,21 +18,16 @@ from . import PiHoleV6ConfigEntry
 from .api import API as PiholeAPI
 from .const import SERVICE_DISABLE, SERVICE_DISABLE_ATTR_DURATION, SERVICE_ENABLE
 from .entity import PiHoleV6Entity
-from .exceptions import (
-    BadGatewayException,
-    BadRequestException,
-    ForbiddenException,
-    GatewayTimeoutException,
-    NotFoundException,
-    RequestFailedException,
-    ServerErrorException,
-    ServiceUnavailableException,
-    TooManyRequestsException,
-    UnauthorizedException,
-)
+from .exceptions import ClientConnectorException, PiHoleAPIException
 
 _LOGGER = logging.getLogger(__name__)
 
+_DISABLE_SCHEMA = {
+    vol.Required(SERVICE_DISABLE_ATTR_DURATION): vol.All(
+        cv.time_period_str, cv.positive_timedelta
+    ),
+}
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -61,17 +56,13 @@ async def async_setup_entry(
             )
         )
 
-    async_add_entities(switches, True)
+    async_add_entities(switches)
 
     # register service
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
         SERVICE_DISABLE,
-        {
-            vol.Required(SERVICE_DISABLE_ATTR_DURATION): vol.All(
-                cv.time_period_str, cv.positive_timedelta
-            ),
-        },
+        _DISABLE_SCHEMA,
         "async_service_disable",
     )
     platform.async_register_entity_service(
@@ -86,15 +77,18 @@ class PiHoleV6Switch(PiHoleV6Entity, SwitchEntity):
 
     _attr_icon = "mdi:pi-hole"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the switch."""
-        return self._name
+    def __init__(
+        self,
+        api: PiholeAPI,
+        coordinator: DataUpdateCoordinator[None],
+        name: str,
+        server_unique_id: str,
+    ) -> None:
+        """Initialize a Pi-hole V6 switch."""
+        super().__init__(api, coordinator, name, server_unique_id)
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique id of the switch."""
-        return f"{self._server_unique_id}/Switch"
+        self._attr_name = self._name
+        self._attr_unique_id = f"{self._server_unique_id}/Switch"
 
     @property
     def is_on(self) -> bool:
@@ -119,21 +113,9 @@ class PiHoleV6Switch(PiHoleV6Entity, SwitchEntity):
             if action == "disable":
                 await self.api.call_blocking_disabled(duration)
 
-            await self.async_update()
-            self.schedule_update_ha_state(force_refresh=True)
-
-        except (
-                BadRequestException,
-                UnauthorizedException,
-                RequestFailedException,
-                ForbiddenException,
-                NotFoundException,
-                TooManyRequestsException,
-                ServerErrorException,
-                BadGatewayException,
-                ServiceUnavailableException,
-                GatewayTimeoutException,
-        ) as err:
+            self.coordinator.async_update_listeners()
+
+        except (PiHoleAPIException, ClientConnectorException) as err:
             _LOGGER.error("Unable to %s Pi-hole V6: %s", action, err)
 
     async def async_service_disable(self, duration: Any = None) -> None:
@@ -202,19 +184,7 @@ class PiHoleV6Group(PiHoleV6Entity, SwitchEntity):
             if action == "disable":
                 await self.api.call_group_disable(self._group)
 
-            await self.async_update()
-            self.schedule_update_ha_state(force_refresh=True)
-
-        except (
-            BadRequestException,
-            UnauthorizedException,
-            RequestFailedException,
-            ForbiddenException,
-            NotFoundException,
-            TooManyRequestsException,
-            ServerErrorException,
-            BadGatewayException,
-            ServiceUnavailableException,
-            GatewayTimeoutException,
-        ) as err:
+            self.coordinator.async_update_listeners()
+
+        except (PiHoleAPIException, ClientConnectorException) as err:
             _LOGGER.error("Unable to %s Pi-hole V6 group %s: %s", action, self._group, err)